@@ -1,7 +1,12 @@
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
+import numpy as np
+import orjson
 import pandas as pd
+import pyarrow.parquet as pq
 from pathlib import Path
+import asyncio
+import functools
 import os
 import uvicorn
 
@@ -27,184 +32,409 @@ Run:
   STATS_DATA_PATH=/path/to/csvs python http_stats_server.py
 """
 
-app = FastAPI()
+
+class ORJSONResponse(Response):
+    """JSON response encoded with orjson (much faster than the stdlib json used by JSONResponse)."""
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Folder with the 22 CSVs (defaults to ./data for local tests)
 DATA_DIR = Path(os.getenv("STATS_DATA_PATH", "./data")).resolve()
 
-# Lazy-loaded dataframes (load on first use)
+# Dataframes (preloaded at startup, see _preload)
 players_per_game = None
 players_totals = None
+player_codes = None  # {lowercased name: player code}; codes are the `_pcode` column
+career_stats = None  # per-player career means, indexed by player code
+top_scorers_by_season = None  # {season: (players, ppg) arrays, the whole season ranked by PPG}
 team_summaries = None
 team_stats_pg = None
 
+# Lookup structures over the team frames (see _team_index)
+team_summaries_index = None
+team_stats_pg_index = None
 
-def _ensure_loaded():
-    """Ensure player-level CSVs are loaded in memory."""
-    global players_per_game, players_totals
-    if players_per_game is None:
-        p = DATA_DIR / "Player Per Game.csv"
-        if not p.exists():
-            raise FileNotFoundError(f"Missing CSV: {p}")
-        players_per_game = pd.read_csv(p)
-    if players_totals is None:
-        p = DATA_DIR / "Player Totals.csv"
-        if not p.exists():
-            raise FileNotFoundError(f"Missing CSV: {p}")
-        players_totals = pd.read_csv(p)
+# CSVs read by the tools (converted to Parquet once, see _parquet_cache)
+DATASETS = ("Player Per Game.csv", "Player Totals.csv", "Team Summaries.csv", "Team Stats Per Game.csv")
+
+# Only the columns the tools read are loaded (see _compact for their dtypes).
+# Stat columns are formatted into tool output, so they stay float64 (float32 shifts e.g. SRS -6.95 to -6.9).
+PLAYER_PG_COLS = [
+    "player", "season", "pts_per_game", "ast_per_game",
+    "trb_per_game", "orb_per_game", "drb_per_game",
+]
+PLAYER_TOTALS_COLS = ["player", "season", "g", "pts", "ast", "trb"]
+TEAM_SUMMARY_COLS = [
+    "season", "team", "abbreviation", "playoffs",
+    "w", "l", "srs", "o_rtg", "d_rtg", "n_rtg", "pace",
+    "ts_percent", "e_fg_percent", "tov_percent", "orb_percent", "ft_fga",
+]
+TEAM_STATS_PG_COLS = [
+    "season", "team", "abbreviation", "playoffs",
+    "pts_per_game", "ast_per_game", "trb_per_game", "x3p_percent",
+]
+# Low-cardinality name columns stored as category (int codes + one copy of each string)
+CATEGORY_COLS = ("player", "team", "abbreviation")
 
 
-def _load_csv(name: str, **kwargs):
-    """Read an arbitrary CSV from DATA_DIR with basic existence check."""
+def _compact(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink a frame in place: integers -> smallest int that holds them (e.g. season -> int16),
+    name columns -> category. Floats go to float32 only when that loses nothing (e.g. whole
+    W/L counts); decimal stats keep float64 so printed values match the CSVs.
+    """
+    for c in df.columns:
+        kind = df[c].dtype.kind
+        if kind == "f":
+            small = df[c].astype("float32")
+            if small.astype("float64").equals(df[c]):
+                df[c] = small
+        elif kind in "iu":
+            df[c] = pd.to_numeric(df[c], downcast="integer")
+        elif c in CATEGORY_COLS:
+            df[c] = df[c].astype("category")
+    return df
+
+
+def _parquet_cache(csv_path: Path):
+    """
+    Return a Parquet copy of `csv_path` stored next to it, (re)writing it when missing or
+    older than the CSV. Returns None when the copy can't be written (e.g. read-only folder).
+    """
+    pq_path = csv_path.with_suffix(".parquet")
+    if pq_path.exists() and pq_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        return pq_path
+    tmp = pq_path.with_name(f"{pq_path.name}.{os.getpid()}.tmp")
+    try:
+        pd.read_csv(csv_path).to_parquet(tmp, engine="pyarrow", compression="zstd")
+        os.replace(tmp, pq_path)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+        return None
+    return pq_path
+
+
+def _load_csv(name: str, columns=None, **kwargs):
+    """
+    Read an arbitrary CSV from DATA_DIR with basic existence check.
+    With `columns`, only those columns are read (missing ones are skipped) and dtypes are compacted.
+    Served from a memory-mapped Parquet copy when possible, falling back to the CSV.
+    """
     p = DATA_DIR / name
     if not p.exists():
         raise FileNotFoundError(f"Missing CSV: {p}")
-    return pd.read_csv(p, **kwargs)
+    pq_path = _parquet_cache(p) if not kwargs else None
+    if pq_path is not None:
+        cols = None
+        if columns is not None:
+            cols = [c for c in pq.read_schema(pq_path).names if c in columns]
+        df = pd.read_parquet(pq_path, engine="pyarrow", columns=cols, memory_map=True)
+    else:
+        if columns is not None:
+            kwargs.setdefault("usecols", lambda c: c in columns)
+        df = pd.read_csv(p, **kwargs)
+    return _compact(df) if columns is not None else df
+
+
+def _add_lowercase(df: pd.DataFrame, cols):
+    """Add `<col>_lc` categorical columns holding lowercased names for case-insensitive matching."""
+    for c in cols:
+        if c in df.columns:
+            df[f"{c}_lc"] = df[c].str.lower().astype("category")
+    return df
+
+
+def _team_index(df: pd.DataFrame) -> dict:
+    """
+    Build lookups over a team frame:
+      - "team" / "abbreviation": {(season, name_lc): row position} for exact matches,
+        keeping the first matching row and preferring regular season (playoffs == 0);
+      - "season_rows": {season: [row positions]} in frame order, so the substring fallback
+        only scans one season and still returns the first matching row;
+      - "arrays": {column: ndarray}, a struct-of-arrays copy of the frame so single-row
+        reads are plain array indexing (see _row_getter).
+    """
+    playoffs = df["playoffs"].tolist() if "playoffs" in df.columns else [0] * len(df)
+    seasons = df["season"].tolist()
+    index = {}
+    for col in ("team", "abbreviation"):
+        if f"{col}_lc" not in df.columns:
+            continue
+        lookup = {}
+        for i, key in enumerate(zip(seasons, df[f"{col}_lc"].tolist())):
+            if not isinstance(key[1], str):
+                continue
+            j = lookup.get(key)
+            if j is None or (playoffs[i] == 0 and playoffs[j] != 0):
+                lookup[key] = i
+        index[col] = lookup
+
+    season_rows = {}
+    for i, season in enumerate(seasons):
+        season_rows.setdefault(season, []).append(i)
+    index["season_rows"] = season_rows
+    index["arrays"] = {c: df[c].to_numpy() for c in df.columns}
+    return index
+
+
+def _build_career_stats(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Materialize per-player seasons and career means (PPG/APG/RPG) once at load.
+    `df` is stably sorted by _pcode, so each player's rows are one contiguous block and
+    the aggregates are NaN-aware per-player reductions straight over the ndarrays.
+    """
+    keys = df["_pcode"].to_numpy()
+    season = df["season"].to_numpy()
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    # Distinct seasons per player from a (code, season) lexsort, so the count does not
+    # depend on whether a player's same-season rows are adjacent in the CSV
+    order = np.lexsort((season, keys))
+    k, s = keys[order], season[order]
+    new_pair = np.r_[True, (k[1:] != k[:-1]) | (s[1:] != s[:-1])]
+
+    def nanmean(values):
+        values = np.asarray(values, dtype="float64")
+        ok = ~np.isnan(values)
+        # ndarray.sum per player, the reduction pandas' mean uses (reduceat accumulates in a
+        # different order, which flips .x5 ties when the means are printed with one decimal)
+        sums = np.array([seg.sum() for seg in np.split(np.where(ok, values, 0.0), starts[1:])])
+        counts = np.add.reduceat(ok.astype("int64"), starts)
+        with np.errstate(invalid="ignore"):
+            return sums / counts
+
+    rpg = df["orb_per_game"].to_numpy(dtype="float64") + df["drb_per_game"].to_numpy(dtype="float64")
+    if "trb_per_game" in df.columns:
+        trb = df["trb_per_game"].to_numpy(dtype="float64")
+        rpg = np.where(np.isnan(trb), rpg, trb)
+    return pd.DataFrame(
+        {
+            "seasons": np.add.reduceat(new_pair.astype("int64"), starts),
+            "ppg": nanmean(df["pts_per_game"]),
+            "apg": nanmean(df["ast_per_game"]),
+            "rpg": nanmean(rpg),
+        },
+        index=pd.Index(keys[starts], name="_pcode"),
+    )
+
+
+def _ensure_loaded():
+    """Ensure player-level CSVs are loaded in memory."""
+    global players_per_game, players_totals, player_codes, career_stats, top_scorers_by_season
+    if players_per_game is None:
+        df = _load_csv("Player Per Game.csv", PLAYER_PG_COLS)
+        # Lowercased names dictionary-encoded to int codes: a name lookup is one dict hit
+        # and per-player data is keyed by a small integer instead of a string
+        names_lc = df["player"].str.lower().astype("category")
+        df["_pcode"] = names_lc.cat.codes
+        player_codes = {name: code for code, name in enumerate(names_lc.cat.categories)}
+        # Stable sort on the code only: each player's rows keep CSV order, so career means
+        # sum in the same order as a plain pandas mean over that player's rows
+        players_per_game = df.sort_values("_pcode", kind="stable", ignore_index=True)
+        career_stats = _build_career_stats(players_per_game)
+        # Each season ranked once, from CSV order with the original sort so PPG ties keep
+        # their order; any n is then a slice, with no sort or selection per request
+        top_scorers_by_season = {}
+        for s, g in df.groupby("season", sort=False):
+            ranked = g.sort_values("pts_per_game", ascending=False)
+            top_scorers_by_season[s] = (ranked["player"].to_numpy(), ranked["pts_per_game"].to_numpy())
+    if players_totals is None:
+        players_totals = _load_csv("Player Totals.csv", PLAYER_TOTALS_COLS)
 
 
 def _ensure_loaded_teams():
-    """Lazy-load team-level CSVs needed by team_summary()."""
-    global team_summaries, team_stats_pg
+    """Load team-level CSVs needed by team_summary()."""
+    global team_summaries, team_stats_pg, team_summaries_index, team_stats_pg_index
     if team_summaries is None:
         # Contains: w,l,srs,o_rtg,d_rtg,n_rtg,pace,ts_percent,e_fg_percent,tov_percent,orb_percent,ft_fga,abbreviation,playoffs,...
-        team_summaries = _load_csv("Team Summaries.csv")
+        team_summaries = _add_lowercase(_load_csv("Team Summaries.csv", TEAM_SUMMARY_COLS), ("team", "abbreviation"))
+        team_summaries_index = _team_index(team_summaries)
     if team_stats_pg is None:
         # Per-game team stats: pts_per_game, ast_per_game, trb_per_game, x3p_percent, ...
-        team_stats_pg = _load_csv("Team Stats Per Game.csv")
+        team_stats_pg = _add_lowercase(_load_csv("Team Stats Per Game.csv", TEAM_STATS_PG_COLS), ("team", "abbreviation"))
+        team_stats_pg_index = _team_index(team_stats_pg)
 
 
-def _match_team_row(df: pd.DataFrame, season: int, team: str):
+@app.on_event("startup")
+async def _preload():
+    """Parse all datasets once at startup so the first request doesn't pay the CSV cost."""
+    _ensure_loaded()
+    _ensure_loaded_teams()
+
+
+def _first_regular(index: dict, rows):
+    """First of `rows` (positions), preferring regular season rows when `playoffs` column exists."""
+    playoffs = index["arrays"].get("playoffs")
+    if playoffs is not None:
+        rows = [i for i in rows if playoffs[i] == 0] or rows
+    return int(rows[0])
+
+
+def _match_team_row(index: dict, season: int, team: str):
     """
-    Return a single row for (season, team) by name or abbreviation.
+    Return the row position for (season, team) by name or abbreviation, or None.
+    Exact matches come from `index` (see _team_index); substring search is the fallback.
     Prefer regular season rows when `playoffs` column exists.
     """
-    sub = df[df["season"] == season]
-    if sub.empty:
-        return None
     t = str(team).strip().lower()
-
-    def _by_name_or_abbr(frame):
-        m = frame[frame["team"].str.lower() == t] if "team" in frame.columns else pd.DataFrame()
-        if m.empty and "abbreviation" in frame.columns:
-            m = frame[frame["abbreviation"].str.lower() == t]
-        if m.empty and "team" in frame.columns:
-            # substring fallback
-            m = frame[frame["team"].str.lower().str.contains(t, na=False)]
-        return m
-
-    m = _by_name_or_abbr(sub)
-    if m.empty:
+    for col in ("team", "abbreviation"):
+        i = index.get(col, {}).get((season, t))
+        if i is not None:
+            return i
+    names = index["arrays"].get("team_lc")
+    if names is None:
         return None
-    if "playoffs" in m.columns:
-        reg = m[m["playoffs"] == 0]
-        if not reg.empty:
-            m = reg
-    return m.iloc[0]
 
-def _pct(x):
-    try:
-        v = float(x)
-        if pd.isna(v):
-            return float("nan")
-        return v*100.0 if v <= 1.0 else v
-    except Exception:
-        return float("nan")
+    # Substring fallback over the season's rows, in frame order
+    rows = index["season_rows"].get(season, [])
+    hits = [i for i in rows if isinstance(names[i], str) and t in names[i]]
+    return _first_regular(index, hits) if hits else None
+
+
+def _row_getter(index: dict, i):
+    """
+    get(col, default) reading row `i` from the column arrays in `index`.
+    With `i` None (no matching row) every field is its default.
+    """
+    arrays = index["arrays"]
+
+    def get(col, default=float("nan")):
+        arr = arrays.get(col)
+        return arr[i] if i is not None and arr is not None else default
+
+    return get
+
+
+# Team Summaries columns stored either as fractions or as percentages
+SUMMARY_PCT_COLS = ["ts_percent", "e_fg_percent", "tov_percent", "orb_percent"]
+
+
+def _pct(values) -> np.ndarray:
+    """Scale fractions (<= 1.0) to percentages in one vectorized pass; NaN/missing stay NaN."""
+    arr = np.asarray(values, dtype="float64")
+    return np.where(arr <= 1.0, arr * 100.0, arr)
 
 # Tool implementations (return plain text)
+# Data is read-only once loaded, so results are memoized on normalized arguments.
+# If a reload path is ever added it must call cache_clear() on these.
+@functools.lru_cache(maxsize=2048)
+def _player_career(player_lc: str):
+    """(seasons, ppg, apg, rpg) from career_stats, or None if unknown."""
+    code = player_codes.get(player_lc)
+    if code is None:
+        return None
+    row = career_stats.loc[code]
+    return int(row["seasons"]), row["ppg"], row["apg"], row["rpg"]
+
+
 def tool_player_summary(player: str) -> str:
     """Compact career line based on Player Per Game (mean across seasons)."""
     _ensure_loaded()
-    df = players_per_game
-    sub = df[df["player"].str.lower() == player.lower()]
-    if sub.empty:
+    career = _player_career(player.strip().lower())
+    if career is None:
         return f"No stats for {player}."
-    seasons = sub["season"].nunique()
-    ppg = sub["pts_per_game"].mean()
-    apg = sub["ast_per_game"].mean()
-    rpg = sub["trb_per_game"].mean() if "trb_per_game" in sub.columns else (sub["orb_per_game"] + sub["drb_per_game"]).mean()
+    seasons, ppg, apg, rpg = career
     return f"{player}: {seasons} seasons. Career averages ~ {ppg:.1f} PPG, {rpg:.1f} RPG, {apg:.1f} APG."
 
 
+@functools.lru_cache(maxsize=1024)
+def _cached_top_scorers(season: int, n: int) -> str:
+    """top_scorers text for a normalized (season, n)."""
+    ranked = top_scorers_by_season.get(season)
+    if ranked is None:
+        return f"No season data for {season}."
+    # Slicing matches DataFrame.head(n): negative n keeps all but the last |n| rows, as before
+    players, pts = (a[:n] for a in ranked)
+    lines = [f"{i}. {p} — {v:.1f} PPG" for i, (p, v) in enumerate(zip(players, pts), 1)]
+    return f"Top scorers {season}:\n" + "\n".join(lines)
+
+
 def tool_top_scorers(season: int, n: int = 10) -> str:
     """Top-N by points per game for a given season."""
     _ensure_loaded()
-    df = players_per_game
-    sub = df[df["season"] == season].copy()
-    if sub.empty:
-        return f"No season data for {season}."
-    top = sub.sort_values("pts_per_game", ascending=False).head(int(n))
-    lines = [f"{i+1}. {row['player']} — {row['pts_per_game']:.1f} PPG" for i, row in top.reset_index(drop=True).iterrows()]
-    return f"Top scorers {season}:\n" + "\n".join(lines)
+    return _cached_top_scorers(int(season), int(n))
 
 
 def tool_compare_players(player_a: str, player_b: str, basis: str = "per_game") -> str:
     """Basic comparison using Player Per Game columns; returns a single-line summary."""
     _ensure_loaded()
-    df = players_per_game
-    A = df[df["player"].str.lower() == player_a.lower()]
-    B = df[df["player"].str.lower() == player_b.lower()]
-    if A.empty or B.empty:
+    A = _player_career(player_a.strip().lower())
+    B = _player_career(player_b.strip().lower())
+    if A is None or B is None:
         return "Not enough data for comparison."
 
-    def line(name, d):
-        rpg_series = d["trb_per_game"] if "trb_per_game" in d.columns else (d["orb_per_game"] + d["drb_per_game"])
-        return f"{name}: PPG {d['pts_per_game'].mean():.1f}, APG {d['ast_per_game'].mean():.1f}, RPG {rpg_series.mean():.1f}"
+    def line(name, career):
+        _, ppg, apg, rpg = career
+        return f"{name}: PPG {ppg:.1f}, APG {apg:.1f}, RPG {rpg:.1f}"
 
     return line(player_a, A) + " | " + line(player_b, B)
 
 
-def tool_team_summary(season: int, team: str) -> str:
-    """Mix advanced metrics (Team Summaries) with per-game stats (Team Stats Per Game)."""
-    _ensure_loaded_teams()
-    row_sum = _match_team_row(team_summaries, season, team)
-    if row_sum is None:
-        return f"No team summary for {team} in {season}."
+@functools.lru_cache(maxsize=1024)
+def _cached_team_summary(season: int, team: str):
+    """team_summary text for a normalized (season, team_lc), or None when the team isn't found."""
+    i_sum = _match_team_row(team_summaries_index, season, team)
+    if i_sum is None:
+        return None
+    get = _row_getter(team_summaries_index, i_sum)
 
     # Advanced metrics
-    abbr = row_sum.get("abbreviation", "")
-    w = int(row_sum.get("w", 0))
-    l = int(row_sum.get("l", 0))
-    srs  = float(row_sum.get("srs", float("nan")))
-    ortg = float(row_sum.get("o_rtg", float("nan")))
-    drtg = float(row_sum.get("d_rtg", float("nan")))
-    nrtg = float(row_sum.get("n_rtg", (ortg - drtg) if (pd.notna(ortg) and pd.notna(drtg)) else float("nan")))
-    pace = float(row_sum.get("pace", float("nan")))
-    ts   = _pct(row_sum.get("ts_percent"))
-    efg  = _pct(row_sum.get("e_fg_percent"))
-    tov  = _pct(row_sum.get("tov_percent"))
-    orb  = _pct(row_sum.get("orb_percent"))
-    ftfga = float(row_sum.get("ft_fga", float("nan")))
+    abbr = get("abbreviation", "")
+    w = int(get("w", 0))
+    l = int(get("l", 0))
+    srs  = float(get("srs"))
+    ortg = float(get("o_rtg"))
+    drtg = float(get("d_rtg"))
+    nrtg = float(get("n_rtg", (ortg - drtg) if not (np.isnan(ortg) or np.isnan(drtg)) else float("nan")))
+    pace = float(get("pace"))
+    ts, efg, tov, orb = _pct([get(c) for c in SUMMARY_PCT_COLS])
+    ftfga = float(get("ft_fga"))
 
     # Per-game box stats
-    row_pg = _match_team_row(team_stats_pg, season, team)
-    pts_pg = float(row_pg.get("pts_per_game", float("nan"))) if row_pg is not None else float("nan")
-    ast_pg = float(row_pg.get("ast_per_game", float("nan"))) if row_pg is not None else float("nan")
-    trb_pg = float(row_pg.get("trb_per_game", float("nan"))) if row_pg is not None else float("nan")
-    x3p_pct = _pct(row_pg.get("x3p_percent")) if row_pg is not None else float("nan")
-
-    name_out = row_sum.get("team", team)
+    i_pg = _match_team_row(team_stats_pg_index, season, team)
+    get_pg = _row_getter(team_stats_pg_index, i_pg)
+    pts_pg = float(get_pg("pts_per_game"))
+    ast_pg = float(get_pg("ast_per_game"))
+    trb_pg = float(get_pg("trb_per_game"))
+    x3p_pct = float(_pct(get_pg("x3p_percent")))
+
+    name_out = get("team", team)
     abbr_out = f" ({abbr})" if abbr else ""
-    parts = [
-        f"{name_out}{abbr_out} {season} RS: {w}-{l}",
-        f"SRS {srs:.1f}" if pd.notna(srs) else None,
-        f"ORtg {ortg:.1f}" if pd.notna(ortg) else None,
-        f"DRtg {drtg:.1f}" if pd.notna(drtg) else None,
-        f"Net {nrtg:+.1f}" if pd.notna(nrtg) else None,
-        f"Pace {pace:.1f}" if pd.notna(pace) else None,
-        f"TS% {ts:.1f}" if pd.notna(ts) else None,
-        f"eFG% {efg:.1f}" if pd.notna(efg) else None,
-        f"TOV% {tov:.1f}" if pd.notna(tov) else None,
-        f"ORB% {orb:.1f}" if pd.notna(orb) else None,
-        f"FT/FGA {ftfga:.3f}" if pd.notna(ftfga) else None,
-        f"PTS/G {pts_pg:.1f}" if pd.notna(pts_pg) else None,
-        f"TRB/G {trb_pg:.1f}" if pd.notna(trb_pg) else None,
-        f"AST/G {ast_pg:.1f}" if pd.notna(ast_pg) else None,
-        f"3P% {x3p_pct:.1f}" if pd.notna(x3p_pct) else None,
-    ]
-    text = ", ".join([p for p in parts if p])
+    metrics = (
+        ("SRS {:.1f}", srs),
+        ("ORtg {:.1f}", ortg),
+        ("DRtg {:.1f}", drtg),
+        ("Net {:+.1f}", nrtg),
+        ("Pace {:.1f}", pace),
+        ("TS% {:.1f}", ts),
+        ("eFG% {:.1f}", efg),
+        ("TOV% {:.1f}", tov),
+        ("ORB% {:.1f}", orb),
+        ("FT/FGA {:.3f}", ftfga),
+        ("PTS/G {:.1f}", pts_pg),
+        ("TRB/G {:.1f}", trb_pg),
+        ("AST/G {:.1f}", ast_pg),
+        ("3P% {:.1f}", x3p_pct),
+    )
+    vals = np.array([v for _, v in metrics], dtype="float64")
+    present = ~np.isnan(vals)
+    parts = [f"{name_out}{abbr_out} {season} RS: {w}-{l}"]
+    parts += [fmt.format(v) for (fmt, _), v, ok in zip(metrics, vals, present) if ok]
+    text = ", ".join(parts)
     return text or f"{name_out} {season}: no metrics found."
 
 
+def tool_team_summary(season: int, team: str) -> str:
+    """Mix advanced metrics (Team Summaries) with per-game stats (Team Stats Per Game)."""
+    _ensure_loaded_teams()
+    text = _cached_team_summary(int(season), str(team).strip().lower())
+    return text if text is not None else f"No team summary for {team} in {season}."
+
+
 # Tools descriptor (mirrors MCP list_tools shape loosely)
 TOOLS = [
     {"name": "player_summary",   "description": "Summary for a player", "inputSchema": {"type": "object", "properties": {"player": {"type": "string"}}, "required": ["player"]}},
@@ -223,6 +453,61 @@ def _jsonrpc_error(id_, code, message):
     """Helper: JSON-RPC error envelope."""
     return {"jsonrpc": "2.0", "id": id_, "error": {"code": code, "message": message}}
 
+# Constant results (and the envelope around them) are serialized once at import;
+# only the request id is encoded per call.
+_INITIALIZE_RESULT = orjson.dumps({"protocolVersion": "2.0"})
+_TOOLS_LIST_RESULT = orjson.dumps({"tools": TOOLS})
+_SHUTDOWN_RESULT = orjson.dumps({"ok": True})
+_ENVELOPE_HEAD = b'{"jsonrpc":"2.0","id":'
+_ENVELOPE_RESULT = b',"result":'
+
+def _jsonrpc_raw_result(id_, result: bytes) -> Response:
+    """Helper: JSON-RPC success envelope around an already-serialized result."""
+    body = b"".join((_ENVELOPE_HEAD, orjson.dumps(id_), _ENVELOPE_RESULT, result, b"}"))
+    return Response(content=body, media_type="application/json")
+
+# tools/call routing: tool name -> fn(arguments) -> text
+TOOL_DISPATCH = {
+    "player_summary":  lambda a: tool_player_summary(a.get("player", "")),
+    "top_scorers":     lambda a: tool_top_scorers(int(a.get("season", 0)), int(a.get("n", 10))),
+    "compare_players": lambda a: tool_compare_players(a.get("player_a", ""), a.get("player_b", ""), a.get("basis", "per_game")),
+    "team_summary":    lambda a: tool_team_summary(int(a.get("season", 0)), a.get("team", "")),
+}
+
+
+# JSON-RPC method handlers: (id, params) -> response
+async def _rpc_initialize(id_, params):
+    return _jsonrpc_raw_result(id_, _INITIALIZE_RESULT)
+
+
+async def _rpc_tools_list(id_, params):
+    return _jsonrpc_raw_result(id_, _TOOLS_LIST_RESULT)
+
+
+async def _rpc_tools_call(id_, params):
+    name = params.get("name")
+    args = params.get("arguments", {}) or {}
+    fn = TOOL_DISPATCH.get(name) if isinstance(name, str) else None
+    if fn is None:
+        return ORJSONResponse(_jsonrpc_error(id_, -32601, f"Unknown tool: {name}"))
+    # pandas work is blocking; run it in a worker thread so the event loop keeps serving
+    text = await asyncio.to_thread(fn, args)
+    # mimic MCP content blocks
+    return ORJSONResponse(_jsonrpc_result(id_, {"content": [{"type": "text", "text": text}], "isError": False}))
+
+
+async def _rpc_shutdown(id_, params):
+    return _jsonrpc_raw_result(id_, _SHUTDOWN_RESULT)
+
+
+METHOD_DISPATCH = {
+    "initialize": _rpc_initialize,
+    "tools/list": _rpc_tools_list,
+    "tools/call": _rpc_tools_call,
+    "shutdown":   _rpc_shutdown,
+}
+
+
 # JSON-RPC endpoint
 @app.post("/jsonrpc")
 async def jsonrpc(request: Request):
@@ -230,49 +515,31 @@ async def jsonrpc(request: Request):
     Minimal JSON-RPC 2.0 endpoint compatible with a bare HTTP client.
     Expects: {"jsonrpc":"2.0","id":1,"method":"tools/call","params":{...}}
     """
-    body = await request.json()
+    try:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as e:
+        return ORJSONResponse(_jsonrpc_error(None, -32700, f"Parse error: {e}"))
     method = body.get("method")
     params = body.get("params", {}) or {}
     id_ = body.get("id")
 
+    handler = METHOD_DISPATCH.get(method) if isinstance(method, str) else None
+    if handler is None:
+        return ORJSONResponse(_jsonrpc_error(id_, -32601, "Method not found"))
     try:
-        # Handle methods
-        # - initialize
-        if method == "initialize":
-            return JSONResponse(_jsonrpc_result(id_, {"protocolVersion": "2.0"}))
-
-        # - tools/list
-        if method == "tools/list":
-            return JSONResponse(_jsonrpc_result(id_, {"tools": TOOLS}))
-
-        # - tools/call
-        if method == "tools/call":
-            name = params.get("name")
-            args = params.get("arguments", {}) or {}
-            # Validate tool name and args
-            if name == "player_summary":
-                text = tool_player_summary(args.get("player", ""))
-            elif name == "top_scorers":
-                text = tool_top_scorers(int(args.get("season", 0)), int(args.get("n", 10)))
-            elif name == "compare_players":
-                text = tool_compare_players(args.get("player_a", ""), args.get("player_b", ""), args.get("basis", "per_game"))
-            elif name == "team_summary":
-                text = tool_team_summary(int(args.get("season", 0)), args.get("team", ""))
-            else:
-                return JSONResponse(_jsonrpc_error(id_, -32601, f"Unknown tool: {name}"))
-            # mimic MCP content blocks
-            return JSONResponse(_jsonrpc_result(id_, {"content": [{"type": "text", "text": text}], "isError": False}))
-
-        # - shutdown
-        if method == "shutdown":
-            return JSONResponse(_jsonrpc_result(id_, {"ok": True}))
-
-        return JSONResponse(_jsonrpc_error(id_, -32601, "Method not found"))
+        return await handler(id_, params)
     except Exception as e:
-        return JSONResponse(_jsonrpc_error(id_, -32000, str(e)))
+        return ORJSONResponse(_jsonrpc_error(id_, -32000, str(e)))
 
 
 if __name__ == "__main__":
     # For local development. Cloud providers typically inject $PORT.
     port = int(os.getenv("PORT", "9000"))
-    uvicorn.run("http_stats_server:app", host="0.0.0.0", port=port)
+    # Build the Parquet copies once here so workers don't all convert the CSVs concurrently
+    for name in DATASETS:
+        if (DATA_DIR / name).exists():
+            _parquet_cache(DATA_DIR / name)
+    # One worker per core by default (each preloads its own copy of the data).
+    # uvloop/httptools come with uvicorn[standard]; "auto" falls back where unavailable (e.g. Windows).
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    uvicorn.run("http_stats_server:app", host="0.0.0.0", port=port, workers=workers, loop="auto", http="auto")
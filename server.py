@@ -15,68 +15,385 @@ Your host (chatbot) should spawn this process via STDIO or use your HTTP bridge.
 """
 
 import argparse
-import json
+import csv
+import functools
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 
+import numpy as np
+import orjson
 import pandas as pd
-from rapidfuzz import process, fuzz
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.feather as feather
+from rapidfuzz import process, fuzz, utils
 from mcp.server.fastmcp import FastMCP
 
 # Loaded once in main()
 TABLES = None
 
-@dataclass
+# Top scorers precomputed per season; larger requests are computed on demand
+TOP_SCORERS_K = 50
+
+# Tables.<attribute> -> CSV file it is read from
+TABLE_FILES = {
+    "per_game": "Player Per Game.csv",
+    "per36": "Per 36 Minutes.csv",
+    "per100": "Per 100 Poss.csv",
+    "totals": "Player Totals.csv",
+    "career": "Player Career Info.csv",
+    "allstar": "All-Star Selections.csv",
+    "awards": "Player Award Shares.csv",
+    "team_summ": "Team Summaries.csv",
+}
+
+# Columns the tools read from each table; the rest are never parsed
+TEAM_SUMMARY_FIELDS = [
+    "w", "l", "srs", "o_rtg", "d_rtg", "n_rtg", "pace",
+    "ts_percent", "e_fg_percent", "tov_percent", "orb_percent",
+]
+REQUIRED_COLS = {
+    "per_game": ["player", "season", "team", "g", "pts_per_game", "ast_per_game", "trb_per_game"],
+    "per36": ["player", "g", "pts_per_36_min", "ast_per_36_min", "trb_per_36_min"],
+    "per100": ["player", "g", "pts_per_100_poss", "ast_per_100_poss", "trb_per_100_poss"],
+    "totals": ["player", "g", "pts", "ast", "trb"],
+    "career": ["player"],
+    "allstar": ["player"],
+    "awards": ["player", "award", "season", "share", "winner"],
+    "team_summ": ["season", "team", *TEAM_SUMMARY_FIELDS],
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Choices:
+    """Candidate names for _best_match, preprocessed once."""
+    names: List[str]  # sorted unique names
+    exact: frozenset  # exact-match fast path
+    folded: Dict[str, str]  # name.casefold() -> name, case-insensitive fast path
+    processed: List[str]  # utils.default_process(name), aligned with `names`
+
+    @classmethod
+    def from_column(cls, col: pd.Series) -> "Choices":
+        names = sorted(set(col.dropna().astype(str)))
+        folded: Dict[str, str] = {}
+        for n in names:
+            folded.setdefault(n.casefold(), n)
+        return cls(names, frozenset(names), folded, [utils.default_process(n) for n in names])
+
+
+def _csv_header(csv_path: Path) -> List[str]:
+    """Column names from the first line of a CSV."""
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        return next(csv.reader(f), [])
+
+
+def _read_csv(csv_path: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Parse a CSV with pyarrow's multithreaded reader, falling back to pandas if pyarrow rejects it.
+    With `columns`, only those (that exist) are parsed. Dates stay text, as pandas would leave them.
+    """
+    include = [c for c in _csv_header(csv_path) if c in columns] if columns is not None else []
+    try:
+        table = pacsv.read_csv(
+            csv_path, convert_options=pacsv.ConvertOptions(strings_can_be_null=True, include_columns=include)
+        )
+        dated = {f.name: pa.string() for f in table.schema if pa.types.is_temporal(f.type)}
+        if dated:
+            table = pacsv.read_csv(
+                csv_path,
+                convert_options=pacsv.ConvertOptions(
+                    strings_can_be_null=True, include_columns=include, column_types=dated
+                ),
+            )
+    except pa.ArrowInvalid:
+        return pd.read_csv(csv_path, encoding="utf-8", usecols=include or None)
+    return table.to_pandas()
+
+
+def _read_cached(csv_path: Path, cache_dir: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Read `csv_path` through a Feather copy in `cache_dir`, (re)writing the copy when missing or
+    older than the CSV. The copy is memory-mapped; if it can't be written the parsed CSV is used.
+    The copy keeps every column, so changing `columns` never needs a rebuild.
+    """
+    cached = cache_dir / f"{csv_path.stem}.feather"
+    if cached.exists() and cached.stat().st_mtime >= csv_path.stat().st_mtime:
+        table = feather.read_table(cached, memory_map=True)
+        if columns is not None:
+            table = table.select([c for c in table.column_names if c in columns])
+        return table.to_pandas(self_destruct=True)
+    df = _read_csv(csv_path)
+    tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        feather.write_feather(df, tmp, compression="uncompressed")
+        os.replace(tmp, cached)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+    if columns is not None:
+        df = df[[c for c in df.columns if c in columns]]
+    return df
+
+
 class Tables:
-    per_game: pd.DataFrame
-    per36: pd.DataFrame
-    per100: pd.DataFrame
-    totals: pd.DataFrame
-    career: pd.DataFrame
-    allstar: pd.DataFrame
-    awards: pd.DataFrame
-    team_summ: pd.DataFrame
-
-
-def load_tables(data_dir: Path) -> Tables:
-    """Read required CSVs and normalize common columns."""
-    def rd(name: str) -> pd.DataFrame:
-        p = data_dir / name
-        if not p.exists():
-            raise FileNotFoundError(f"Missing CSV: {p}")
-        return pd.read_csv(p, encoding="utf-8")
-
-    per_game = rd("Player Per Game.csv")
-    per36 = rd("Per 36 Minutes.csv")
-    per100 = rd("Per 100 Poss.csv")
-    totals = rd("Player Totals.csv")
-    career = rd("Player Career Info.csv")
-    allstar = rd("All-Star Selections.csv")
-    awards = rd("Player Award Shares.csv")
-    team_summ = rd("Team Summaries.csv")
-
-    # Season as numeric
-    for df in (per_game, per36, per100, totals, team_summ):
+    """
+    The CSV tables and lookup indexes the tools use. Each is read or built on first access,
+    so a session only pays for the tables its tools actually touch.
+    """
+
+    def __init__(self, data_dir: Path, cache_dir: Optional[Path] = None):
+        self.data_dir = data_dir
+        self.cache_dir = cache_dir
+        # {table name: {player: row positions}}, see player_index
+        self._by_player: Dict[str, Dict[str, np.ndarray]] = {}
+
+    def _rd(self, table: str) -> pd.DataFrame:
+        """Read one table's REQUIRED_COLS (through a Feather copy in cache_dir, if set) and normalize common columns."""
+        p = self.data_dir / TABLE_FILES[table]
+        cols = REQUIRED_COLS[table]
+        df = _read_cached(p, self.cache_dir, cols) if self.cache_dir is not None else _read_csv(p, cols)
+
+        # Season as numeric
         if "season" in df.columns:
             df["season"] = pd.to_numeric(df["season"], errors="coerce")
-
-    # Trim player names
-    for df in (per_game, per36, per100, totals, career, allstar, awards):
+        # Trim player names
         if "player" in df.columns:
             df["player"] = df["player"].astype(str).str.strip()
+        # Repeated names as category: equality filters compare int codes instead of Python strings
+        for col in ("player", "team", "award"):
+            if col in df.columns:
+                df[col] = df[col].astype("category")
+        # Newest season first, as the CSVs ship; each season is then one contiguous block (see _season_rows)
+        if table == "per_game" and not df["season"].is_monotonic_decreasing:
+            df = df.sort_values("season", ascending=False, kind="stable", na_position="first", ignore_index=True)
+        return df
+
+    @functools.cached_property
+    def per_game(self) -> pd.DataFrame:
+        return self._rd("per_game")
+
+    @functools.cached_property
+    def per36(self) -> pd.DataFrame:
+        return self._rd("per36")
+
+    @functools.cached_property
+    def per100(self) -> pd.DataFrame:
+        return self._rd("per100")
+
+    @functools.cached_property
+    def totals(self) -> pd.DataFrame:
+        return self._rd("totals")
+
+    @functools.cached_property
+    def career(self) -> pd.DataFrame:
+        return self._rd("career")
+
+    @functools.cached_property
+    def allstar(self) -> pd.DataFrame:
+        return self._rd("allstar")
+
+    @functools.cached_property
+    def awards(self) -> pd.DataFrame:
+        return self._rd("awards")
+
+    @functools.cached_property
+    def team_summ(self) -> pd.DataFrame:
+        return self._rd("team_summ")
+
+    def player_index(self, table: str) -> Dict[str, np.ndarray]:
+        """{player: row positions in `table`}, so player lookups skip full-column scans."""
+        index = self._by_player.get(table)
+        if index is None:
+            index = getattr(self, table).groupby("player", sort=False, observed=True).indices
+            self._by_player[table] = index
+        return index
+
+    @functools.cached_property
+    def per_game_seasons(self) -> np.ndarray:
+        """per_game's season column in ascending order (a reversed view), for np.searchsorted."""
+        return self.per_game["season"].to_numpy()[::-1]
+
+    @functools.cached_property
+    def team_summ_row(self) -> Dict[Tuple[int, str], int]:
+        """{(season, team): first team_summ row position}."""
+        return {
+            (int(season), team): int(rows[0])
+            for (season, team), rows in self.team_summ.groupby(["season", "team"], observed=True).indices.items()
+        }
 
-    return Tables(per_game, per36, per100, totals, career, allstar, awards, team_summ)
+    @functools.cached_property
+    def top_scorers_by_season(self) -> Dict[int, List[Dict[str, Any]]]:
+        """{season: top TOP_SCORERS_K records by pts_per_game}."""
+        if "pts_per_game" not in self.per_game.columns:
+            return {}
+        seasons = self.per_game_seasons
+        return {
+            season: _season_top_scorers(self.per_game, _season_rows(seasons, season), TOP_SCORERS_K)
+            for season in pd.unique(seasons[~np.isnan(seasons)])
+        }
+
+    # Fuzzy-match choices, computed once instead of per call
+
+    @functools.cached_property
+    def per_game_players(self) -> Choices:
+        return Choices.from_column(self.per_game["player"])
+
+    @functools.cached_property
+    def per36_players(self) -> Choices:
+        return Choices.from_column(self.per36["player"])
+
+    @functools.cached_property
+    def per100_players(self) -> Choices:
+        return Choices.from_column(self.per100["player"])
+
+    @functools.cached_property
+    def team_summ_teams_by_season(self) -> Dict[int, Choices]:
+        return {
+            int(season): Choices.from_column(g["team"])
+            for season, g in self.team_summ.groupby("season", sort=False)
+        }
+
+
+def load_tables(data_dir: Path, cache_dir: Optional[Path] = None) -> Tables:
+    """Check the required CSVs exist; they are read lazily on first use (see Tables)."""
+    for name in TABLE_FILES.values():
+        p = data_dir / name
+        if not p.exists():
+            raise FileNotFoundError(f"Missing CSV: {p}")
+    return Tables(data_dir, cache_dir)
+
+
+def _top_award_shares(wdf: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Each award's best-share row (the first one on ties), ordered by award name.
+    Missing shares rank lowest, so awards with no recorded share (early ROYs) still appear.
+    """
+    codes = wdf["award"].cat.codes.to_numpy()
+    share = wdf["share"].to_numpy(dtype=float)
+    # Sort by award, then share descending; lexsort is stable, so ties keep row order
+    order = np.lexsort((-np.where(np.isnan(share), -np.inf, share), codes))
+    order = order[codes[order] >= 0]  # drop rows without an award
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = codes[order][1:] != codes[order][:-1]
+    picked = order[first]
+    award = wdf["award"].to_numpy()[picked]
+    season = wdf["season"].to_numpy()[picked]
+    winner = wdf["winner"].to_numpy()[picked]
+    return [
+        {"award": a, "season": int(s), "share": float(sh), "winner": bool(w)}
+        for a, s, sh, w in zip(award, season, share[picked], winner)
+    ]
+
+
+def _season_rows(seasons: np.ndarray, season: int) -> slice:
+    """Row positions of `season` in a newest-first table, given its seasons ascending (two binary searches)."""
+    n = len(seasons)
+    return slice(n - int(np.searchsorted(seasons, season, side="right")), n - int(np.searchsorted(seasons, season, side="left")))
+
+
+def _records(df: pd.DataFrame, cols: List[str]) -> List[Dict[str, Any]]:
+    """Rows of `df` as {col: value} dicts, unboxing each column once instead of per cell."""
+    values = [df[c].tolist() for c in cols]
+    return [dict(zip(cols, row)) for row in zip(*values)]
+
+
+def _season_top_scorers(per_game: pd.DataFrame, rows: slice, n: int) -> List[Dict[str, Any]]:
+    """Top-n records by pts_per_game among the given per_game rows (one season)."""
+    cols = ["player", "team", "pts_per_game", "g"]
+    out = (
+        per_game.iloc[rows, [per_game.columns.get_loc(c) for c in cols]]
+        .dropna()
+        .sort_values("pts_per_game", ascending=False)
+        .head(n)
+    )
+    return _records(out, cols)
+
+
+def _player_rows(T: Tables, table: str, name: str, cols: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Rows of `table` for player `name` (an empty frame if none).
+    Only `cols` (those present) are gathered, so callers don't pay for columns they never read.
+    """
+    df = getattr(T, table)
+    rows = T.player_index(table).get(name)
+    where = [df.columns.get_loc(c) for c in cols if c in df.columns] if cols is not None else slice(None)
+    return df.iloc[rows if rows is not None else slice(0, 0), where]
+
+
+def _player_row_count(T: Tables, table: str, name: str) -> int:
+    """Number of rows of `table` for player `name`."""
+    rows = T.player_index(table).get(name)
+    return len(rows) if rows is not None else 0
 
 
 # Utils
 
-def _best_match(name: str, choices: List[str]) -> Tuple[str, float]:
-    """Fuzzy-match a name against a list of choices."""
-    if not choices:
+# Below this WRatio score a query is treated as "not found" rather than matched
+MATCH_SCORE_CUTOFF = 60
+
+
+def _best_match(name: str, choices: Choices) -> Tuple[str, float]:
+    """
+    Fuzzy-match a name against precomputed choices.
+    Exact names (ignoring case and surrounding spaces) skip the scorer; among names tied on
+    the best score, one containing a query word as a whole word wins, then the alphabetically
+    first; weak matches (below MATCH_SCORE_CUTOFF) return (name, 0.0).
+    """
+    if name in choices.exact:
+        return name, 100.0
+    folded = choices.folded.get(name.strip().casefold())
+    if folded is not None:
+        return folded, 100.0
+    if not choices.names:
+        return name, 0.0
+    query = utils.default_process(name)
+    # Every candidate's score in one C pass (scores below the cutoff come back as 0)
+    scores = process.cdist(
+        [query],
+        choices.processed,
+        scorer=fuzz.WRatio,
+        processor=None,
+        score_cutoff=MATCH_SCORE_CUTOFF,
+        dtype=np.float64,
+    )[0]
+    best = scores.max()
+    if best < MATCH_SCORE_CUTOFF:
         return name, 0.0
-    match, score, _ = process.extractOne(name, choices, scorer=fuzz.WRatio)
-    return match, float(score or 0.0)
+    tied = np.flatnonzero(scores == best)
+    idx = int(tied[0])
+    if len(tied) > 1:
+        # One-word queries tie a lot (WRatio 90 for any name containing the word, e.g. "Curry"
+        # in "Carey Scurry"): prefer a whole-word hit; `tied` is already in alphabetical order
+        words = set(query.split())
+        idx = next((int(i) for i in tied if not words.isdisjoint(choices.processed[i].split())), idx)
+    return choices.names[idx], float(best)
+
+
+def _weighted_sums(
+    df: pd.DataFrame, cols: List[str], weight: str = "g", dropna: bool = True
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Game-weighted sums for several stat columns from one missing-value mask.
+    Returns, per column: sum(stat * g), sum(g) over the rows used, and the number of rows used.
+    With `dropna`, rows missing the stat or the weight are left out of the sums (df.dropna());
+    otherwise their products count as zero in place (Series.sum). Each sum is a 1-D
+    ndarray.sum over the same values pandas reduces, so the printed averages don't drift.
+    """
+    G = df[weight].to_numpy(dtype=float)
+    M = np.column_stack(
+        [df[c].to_numpy(dtype=float) if c in df.columns else np.full(len(df), np.nan) for c in cols]
+    )
+    mask = ~np.isnan(M) & ~np.isnan(G)[:, None]
+    P = np.ascontiguousarray((M * G[:, None]).T)  # one contiguous row of products per column
+    if dropna:
+        sums = [row[m].sum() for row, m in zip(P, mask.T)]
+        gsums = [G[m].sum() for m in mask.T]
+    else:
+        sums = [np.where(m, row, 0.0).sum() for row, m in zip(P, mask.T)]
+        gsums = [np.where(m, G, 0.0).sum() for m in mask.T]
+    return np.array(sums), np.array(gsums), mask.sum(axis=0)
 
 
 def _ensure_loaded():
@@ -88,30 +405,34 @@ def _ensure_loaded():
 
 
 def _json(obj: Any) -> str:
-    """Pretty JSON for text content blocks."""
-    return json.dumps(obj, ensure_ascii=False, indent=2)
+    """Pretty JSON for text content blocks (NaN is written as null)."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
 
 
 # FastMCP server instance
 mcp = FastMCP("DunkMaster Stats MCP (Local)")
 
+# Tools are pure functions of TABLES (set once in main), so their results are memoized
+TOOL_CACHE_SIZE = 1024
+
 
 @mcp.tool(name="player_summary")
 def player_summary(player: str) -> str:
     """Compact career summary with span, teams, weighted career averages, all-star & top award shares."""
     _ensure_loaded()
+    return _player_summary(player)
+
+
+@functools.lru_cache(maxsize=TOOL_CACHE_SIZE)
+def _player_summary(player: str) -> str:
     T = TABLES
 
-    choices = sorted(set(T.per_game["player"].dropna().astype(str)))
-    best, score = _best_match(player, choices)
+    best, score = _best_match(player, T.per_game_players)
 
-    pdf = T.per_game[T.per_game["player"] == best].copy()
-    tdf = T.totals[T.totals["player"] == best].copy()
-    cdf = T.career[T.career["player"] == best].copy()
-    adf = T.allstar[T.allstar["player"] == best].copy()
-    wdf = T.awards[T.awards["player"] == best].copy()
+    pdf = _player_rows(T, "per_game", best, ["season", "team", "g", "pts_per_game", "ast_per_game", "trb_per_game"])
+    wdf = _player_rows(T, "awards", best, ["award", "season", "share", "winner"])
 
-    if pdf.empty and tdf.empty and cdf.empty:
+    if pdf.empty and not _player_row_count(T, "totals", best) and not _player_row_count(T, "career", best):
         return _json(
             {"match": None, "score": 0.0, "error": f"Player '{player}' not found."}
         )
@@ -120,28 +441,25 @@ def player_summary(player: str) -> str:
     span = (min(seasons), max(seasons)) if seasons else (None, None)
     teams = sorted(set(pdf["team"].dropna().astype(str))) if "team" in pdf.columns else []
 
-    def wavg(df: pd.DataFrame, num: str, den: str = "g") -> Optional[float]:
-        """Game-weighted average: sum(num * g) / sum(g)."""
-        if num not in df.columns or den not in df.columns:
-            return None
-        sub = df[[num, den]].dropna()
-        if sub.empty:
-            return None
-        return float((sub[num] * sub[den]).sum() / sub[den].sum())
-
-    pts = wavg(pdf, "pts_per_game") or wavg(tdf, "pts")
-    ast = wavg(pdf, "ast_per_game") or wavg(tdf, "ast")
-    trb = wavg(pdf, "trb_per_game") or wavg(tdf, "trb")
-
-    allstar_count = int(adf.shape[0]) if not adf.empty else 0
+    def wavgs(df: pd.DataFrame, cols: List[str]) -> List[Optional[float]]:
+        """Game-weighted averages sum(col * g) / sum(g); None where no rows qualify."""
+        if "g" not in df.columns:
+            return [None] * len(cols)
+        sums, gsums, used = _weighted_sums(df, cols)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return [float(s / w) if n else None for s, w, n in zip(sums, gsums, used)]
+
+    # Per-game averages, falling back to totals when missing or zero (totals are only read then)
+    pts, ast, trb = wavgs(pdf, ["pts_per_game", "ast_per_game", "trb_per_game"])
+    if not (pts and ast and trb):
+        tdf = _player_rows(T, "totals", best, ["g", "pts", "ast", "trb"])
+        tot = wavgs(tdf, ["pts", "ast", "trb"])
+        pts, ast, trb = (pg or t for pg, t in zip((pts, ast, trb), tot))
+
+    allstar_count = _player_row_count(T, "allstar", best)
     top_awards = []
     if not wdf.empty and "award" in wdf.columns:
-        top_awards = (
-            wdf.groupby("award")
-            .apply(lambda g: g.sort_values("share", ascending=False).head(1))
-            .reset_index(drop=True)[["award", "season", "share", "winner"]]
-            .to_dict(orient="records")
-        )
+        top_awards = _top_award_shares(wdf)
 
     return _json(
         {
@@ -164,35 +482,51 @@ def player_summary(player: str) -> str:
 def top_scorers(season: int, n: int = 10) -> str:
     """Return top-N by points per game for a season."""
     _ensure_loaded()
+    return _top_scorers(season, n)
+
+
+@functools.lru_cache(maxsize=TOOL_CACHE_SIZE)
+def _top_scorers(season: int, n: int) -> str:
     T = TABLES
-    df = T.per_game[T.per_game["season"] == season].copy()
-    if df.empty or "pts_per_game" not in df.columns:
+    n = int(n)
+    if 0 <= n <= TOP_SCORERS_K:
+        return _json(T.top_scorers_by_season.get(season, [])[:n])
+    if "pts_per_game" not in T.per_game.columns:
         return _json([])
-    out = (
-        df[["player", "team", "pts_per_game", "g"]]
-        .dropna()
-        .sort_values("pts_per_game", ascending=False)
-        .head(int(n))
-    )
-    return _json(out.to_dict(orient="records"))
+    rows = _season_rows(T.per_game_seasons, season)
+    return _json(_season_top_scorers(T.per_game, rows, n))
 
 
 @mcp.tool(name="compare_players")
 def compare_players(player_a: str, player_b: str, basis: str = "per_game") -> str:
     """Compare career averages using a basis: per_game | per_36 | per_100."""
     _ensure_loaded()
+    # (a, b) and (b, a) share one cache entry; swap back on output
+    swap = player_b < player_a
+    first, second = (player_b, player_a) if swap else (player_a, player_b)
+    basis, career_a, career_b = _compare_players(first, second, basis)
+    if swap:
+        career_a, career_b = career_b, career_a
+    return _json({"basis": basis, "player_a": career_a, "player_b": career_b})
+
+
+@functools.lru_cache(maxsize=TOOL_CACHE_SIZE)
+def _compare_players(player_a: str, player_b: str, basis: str) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
     T = TABLES
     basis_map = {
         "per_game": (
-            T.per_game,
+            "per_game",
+            T.per_game_players,
             {"pts": "pts_per_game", "ast": "ast_per_game", "trb": "trb_per_game"},
         ),
         "per_36": (
-            T.per36,
+            "per36",
+            T.per36_players,
             {"pts": "pts_per_36_min", "ast": "ast_per_36_min", "trb": "trb_per_36_min"},
         ),
         "per_100": (
-            T.per100,
+            "per100",
+            T.per100_players,
             {
                 "pts": "pts_per_100_poss",
                 "ast": "ast_per_100_poss",
@@ -202,64 +536,50 @@ def compare_players(player_a: str, player_b: str, basis: str = "per_game") -> st
     }
     if basis not in basis_map:
         basis = "per_game"
-    df, cols = basis_map[basis]
-
-    choices = sorted(set(df["player"].dropna().astype(str)))
+    table, choices, cols = basis_map[basis]
     a_name, a_score = _best_match(player_a, choices)
     b_name, b_score = _best_match(player_b, choices)
 
-    def career(subdf: pd.DataFrame, who: str) -> Dict[str, Any]:
-        sub = subdf[subdf["player"] == who]
+    def career(who: str) -> Dict[str, Any]:
+        sub = _player_rows(T, table, who, ["g", *cols.values()])
         if sub.empty:
             return {"match": who, "g": 0, "pts": None, "ast": None, "trb": None}
-        g = sub["g"].dropna()
-        gsum = float(g.sum()) if not g.empty else 0.0
+        gsum = float(np.nansum(sub["g"].to_numpy(dtype=float)))
 
-        def wavg(col: str) -> Optional[float]:
-            if col not in sub.columns or gsum == 0:
-                return None
-            return float((sub[col] * sub["g"]).sum() / gsum)
+        # Each stat's weighted sum is computed once, from one mask; averages are over every game played
+        sums, _, _ = _weighted_sums(sub, [cols[k] for k in ("pts", "ast", "trb")], dropna=False)
+        out: Dict[str, Any] = {"match": who, "g": int(gsum)}
+        for k, total in zip(("pts", "ast", "trb"), sums):
+            out[k] = round(float(total / gsum), 2) if cols[k] in sub.columns and gsum != 0 else None
+        return out
 
-        return {
-            "match": who,
-            "g": int(gsum),
-            "pts": round(wavg(cols["pts"]), 2) if wavg(cols["pts"]) is not None else None,
-            "ast": round(wavg(cols["ast"]), 2) if wavg(cols["ast"]) is not None else None,
-            "trb": round(wavg(cols["trb"]), 2) if wavg(cols["trb"]) is not None else None,
-        }
-
-    result = {
-        "basis": basis,
-        "player_a": career(df, a_name) | {"score": a_score},
-        "player_b": career(df, b_name) | {"score": b_score},
-    }
-    return _json(result)
+    return basis, career(a_name) | {"score": a_score}, career(b_name) | {"score": b_score}
 
 
 @mcp.tool(name="team_summary")
 def team_summary(season: int, team: str) -> str:
     """Return W/L, SRS, ORtg, DRtg, pace, and a few shooting/possession metrics."""
     _ensure_loaded()
+    return _team_summary(season, team)
+
+
+@functools.lru_cache(maxsize=TOOL_CACHE_SIZE)
+def _team_summary(season: int, team: str) -> str:
     T = TABLES
-    df = T.team_summ[T.team_summ["season"] == season].copy()
-    if df.empty:
+    choices = T.team_summ_teams_by_season.get(season)
+    if choices is None:
         return _json({"error": f"No data for season {season}"})
-    choices = sorted(set(df["team"].dropna().astype(str)))
     best, score = _best_match(team, choices)
-    row = df[df["team"] == best].head(1)
-    if row.empty:
+    pos = T.team_summ_row.get((season, best))
+    if pos is None:
         return _json({"match": None, "score": 0.0, "error": f"Team '{team}' not found"})
-    r = row.iloc[0].to_dict()
-    fields = [
-        "w", "l", "srs", "o_rtg", "d_rtg", "n_rtg", "pace",
-        "ts_percent", "e_fg_percent", "tov_percent", "orb_percent",
-    ]
+    r = T.team_summ.iloc[pos].to_dict()
     return _json(
         {
             "match": best,
             "score": score,
             "season": int(season),
-            "summary": {k: r.get(k) for k in fields if k in r},
+            "summary": {k: r.get(k) for k in TEAM_SUMMARY_FIELDS if k in r},
         }
     )
 
@@ -271,13 +591,18 @@ def main():
     global TABLES
     parser = argparse.ArgumentParser()
     parser.add_argument("--data", required=True, help="Path to folder containing the 22 CSV files.")
+    parser.add_argument(
+        "--cache-dir",
+        help="Optional folder for Feather copies of the CSVs; later starts memory-map them instead of parsing.",
+    )
     args = parser.parse_args()
 
     data_dir = Path(args.data).expanduser().resolve()
     if not data_dir.exists():
         raise SystemExit(f"Data folder does not exist: {data_dir}")
+    cache_dir = Path(args.cache_dir).expanduser().resolve() if args.cache_dir else None
 
-    TABLES = load_tables(data_dir)
+    TABLES = load_tables(data_dir, cache_dir)
 
     # Start STDIO server (host speaks JSON-RPC over stdin/stdout).
     if hasattr(mcp, "run_stdio"):